@@ -8,15 +8,16 @@ from models import setup_db, Question, Category
 
 QUESTIONS_PER_PAGE = 10
 
-def create_app(test_config=None):
+def create_app(test_config=None, create_schema=True):
     # create and configure the app
+    # create_schema=False skips db.create_all(), for databases that are already migrated or seeded
     app = Flask(__name__)
 
     if test_config is None:
-        setup_db(app)
+        setup_db(app, create_schema=create_schema)
     else:
         database_path = test_config.get('SQLALCHEMY_DATABASE_URI')
-        setup_db(app, database_path=database_path)
+        setup_db(app, database_path=database_path, create_schema=create_schema)
 
     """
     @TODO: Set up CORS. Allow '*' for origins. Delete the sample route after completing the TODOs
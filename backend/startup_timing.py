@@ -0,0 +1,39 @@
+"""
+Reports how long importing the app factory and calling create_app take.
+
+    python startup_timing.py
+    python startup_timing.py --database-url sqlite://
+
+Without --database-url the app connects to the database from .env, like `flask run`.
+"""
+import argparse
+import time
+
+parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+parser.add_argument('--database-url', default=None, help='database to start the app against')
+parser.add_argument('--runs', type=int, default=5, help='create_app calls to average over')
+args = parser.parse_args()
+
+start = time.perf_counter()
+from flaskr import create_app
+from models import db
+import_time = time.perf_counter() - start
+
+test_config = {'SQLALCHEMY_DATABASE_URI': args.database_url} if args.database_url else None
+
+
+def time_create_app(create_schema):
+    total = 0.0
+    for _ in range(args.runs):
+        start = time.perf_counter()
+        app = create_app(test_config, create_schema=create_schema)
+        total += time.perf_counter() - start
+
+        with app.app_context():
+            db.get_engine(app).dispose()
+    return total / args.runs
+
+
+print(f'import flaskr                        {import_time * 1000:8.1f} ms')
+print(f'create_app()                         {time_create_app(True) * 1000:8.1f} ms')
+print(f'create_app(create_schema=False)      {time_create_app(False) * 1000:8.1f} ms')